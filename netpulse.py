@@ -14,12 +14,18 @@ Author: Karndeep Baror - Ethical Hacker
 
 from __future__ import annotations
 import argparse
+import asyncio
+import functools
+import http.client
+import shutil
 import socket
 import sys
 import time
 import threading
+import urllib.parse
 import urllib.request
 import urllib.error
+from array import array
 from collections import deque
 from typing import List, Tuple
 
@@ -39,14 +45,47 @@ def col(s: str, c: str) -> str:
     return f"{c}{s}{RESET}"
 
 # ---- Utilities --------
+CLEAR_SCREEN = "\033[2J\033[H"
+CURSOR_HOME = "\033[H"
+ERASE_EOL = "\033[K"       # erase to end of line
+ERASE_BELOW = "\033[J"     # erase from cursor to end of screen
+HIDE_CURSOR = "\033[?25l"
+SHOW_CURSOR = "\033[?25h"
+IS_WINDOWS = sys.platform.startswith("win")
+# only set when a Windows console refuses VT mode (pre-1607 conhost)
+_use_cls = False
+
+def enable_vt_mode() -> bool:
+    """Turn on ANSI escape processing for the Windows console. True if ANSI output works."""
+    if not IS_WINDOWS:
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
 def clear():
-    if sys.platform.startswith("win"):
+    if _use_cls:
         _ = __import__("os").system("cls")
     else:
-        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.write(CLEAR_SCREEN)
+
+# [second, formatted] of the last now_ts() call; the string only changes once a second
+_LAST_TS = [0, ""]
 
 def now_ts() -> str:
-    return time.strftime("%Y-%m-%d %H:%M:%S")
+    t = int(time.time())
+    if t != _LAST_TS[0]:
+        _LAST_TS[0] = t
+        _LAST_TS[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+    return _LAST_TS[1]
 
 def human_mbps(bps: float) -> str:
     """Convert bytes/sec to Mbps string."""
@@ -59,54 +98,167 @@ def spinner(ch):
     return "|/-\\"[ch % 4]
 
 # ---------------- Networking helpers ----------------
-def tcp_connect_time(host: str, port: int, timeout: float = 1.0) -> float:
-    """Return connect time in milliseconds, or None on failure."""
+def pick_address(addrinfo: list) -> tuple:
+    """Choose the getaddrinfo() entry to probe: the first IPv4 one, else the first one."""
+    return next((ai for ai in addrinfo if ai[0] == socket.AF_INET), addrinfo[0])
+
+# receive buffer for the download probe: lets more data be in flight per RTT
+PROBE_RCVBUF = 1 << 20
+
+def _tuned_socket(address: Tuple[str, int], timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
+                  source_address=None) -> socket.socket:
+    """Like socket.create_connection, but sets TCP_NODELAY / SO_RCVBUF before connecting."""
+    host, port = address
+    err = None
+    for af, socktype, proto, _, sockaddr in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM):
+        sock = socket.socket(af, socktype, proto)
+        try:
+            # best effort: a platform lacking an option still gets a working socket
+            for level, opt, value in ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                                      (socket.SOL_SOCKET, socket.SO_RCVBUF, PROBE_RCVBUF)):
+                try:
+                    sock.setsockopt(level, opt, value)
+                except OSError:
+                    pass
+            if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as e:
+            err = e
+            sock.close()
+    raise err if err is not None else OSError(f"getaddrinfo returned nothing for {host}")
+
+class TunedHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection whose socket gets the probe socket options before connect()."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # http.client's own hook for socket creation; connect() keeps its audit
+        # event, TCP_NODELAY handling and tunnel support
+        self._create_connection = _tuned_socket
+
+class _TunedHTTPHandler(urllib.request.HTTPHandler):
+    def http_open(self, req):
+        return self.do_open(TunedHTTPConnection, req)
+
+_handlers = [_TunedHTTPHandler]
+if hasattr(http.client, "HTTPSConnection"):  # ssl may be missing (minimal Termux builds)
+    class TunedHTTPSConnection(http.client.HTTPSConnection, TunedHTTPConnection):
+        """HTTPSConnection whose TLS layer wraps the tuned socket from TunedHTTPConnection."""
+
+    class _TunedHTTPSHandler(urllib.request.HTTPSHandler):
+        def https_open(self, req):
+            return self.do_open(TunedHTTPSConnection, req, context=self._context)
+
+    _handlers.append(_TunedHTTPSHandler)
+_probe_opener = urllib.request.build_opener(*_handlers)
+
+def _probe_headers(bytes_to_read: int) -> dict:
+    """
+    Request headers for a download probe. Range asks the server to send
+    exactly bytes_to_read bytes (206), so nothing unread piles up in the
+    socket buffer; identity encoding keeps the byte count honest.
+    """
+    return {
+        "User-Agent": "NetPulse/1.0",
+        "Range": f"bytes=0-{bytes_to_read - 1}",
+        "Accept-Encoding": "identity",
+    }
+
+READ_CHUNK = 64 * 1024  # per read1(); roughly one SO_RCVBUF quantum
+
+def _read_body(resp, bytes_to_read: int, timeout: float = None, sock: socket.socket = None) -> int:
+    """Read and discard up to bytes_to_read body bytes within timeout seconds; return count read.
+    With sock, each recv is capped at the remaining budget; a timed-out body is left half-read."""
+    read = 0
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    sock_timeout = sock.gettimeout() if sock is not None else None
     try:
-        start = time.time()
-        with socket.create_connection((host, port), timeout=timeout):
-            end = time.time()
-        return (end - start) * 1000.0
-    except Exception:
-        return None
+        while read < bytes_to_read:
+            if deadline is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                if sock is not None:
+                    sock.settimeout(remaining)
+            n = len(resp.read1(min(READ_CHUNK, bytes_to_read - read)))
+            if not n:
+                break
+            read += n
+    except socket.timeout:
+        pass
+    finally:
+        if sock is not None:
+            sock.settimeout(sock_timeout)
+    if getattr(resp, "length", None) == 0:
+        # read1() never marks a fully read body as done; this lets
+        # http.client release the connection for keep-alive reuse
+        resp.read()
+    return read
+
+def _response_socket(resp):
+    """The socket under a urllib HTTP(S) response, or None (file:, ftp:, unknown layout)."""
+    raw = getattr(getattr(resp, "fp", None), "raw", None)
+    sock = getattr(raw, "_sock", None)
+    return sock if isinstance(sock, socket.socket) else None
 
 def download_probe(url: str, bytes_to_read: int = 256 * 1024, timeout: float = 4.0) -> Tuple[int, float]:
     """
     Download up to bytes_to_read from url and return (bytes_read, seconds_elapsed).
-    Uses urllib (stdlib). Caller converts to Mbps.
+    Uses urllib (stdlib) with a fresh connection per call. Caller converts to Mbps.
     """
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "NetPulse/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            read = 0
-            start = time.time()
-            while read < bytes_to_read:
-                chunk = resp.read(min(32 * 1024, bytes_to_read - read))
-                if not chunk:
-                    break
-                read += len(chunk)
-            end = time.time()
-        elapsed = max(0.0001, end - start)
+        req = urllib.request.Request(url, headers=_probe_headers(bytes_to_read))
+        with _probe_opener.open(req, timeout=timeout) as resp:
+            # non-HTTP responses (file:, ftp:) carry no status
+            if getattr(resp, "status", None) not in (200, 206, None):
+                return 0, 0.0
+            start = time.perf_counter_ns()
+            read = _read_body(resp, bytes_to_read, timeout, _response_socket(resp))
+            end = time.perf_counter_ns()
+        elapsed = (end - start) / 1_000_000_000
         return read, elapsed
     except Exception:
         return 0, 0.0
 
 # ---------------- Sparkline helper ----------------
 SPARK_CHARS = "▁▂▃▄▅▆▇█"
-def sparkline(values: List[float], width: int = 30) -> str:
-    if not values:
-        return " " * width
-    vals = list(values)[-width:]
-    mx = max(vals) if max(vals) > 0 else 1.0
-    out = ""
-    for v in vals:
-        idx = int((v / mx) * (len(SPARK_CHARS) - 1))
-        out += SPARK_CHARS[idx]
-    # pad
-    if len(out) < width:
-        out = (" " * (width - len(out))) + out
-    return out
+
+def make_sparkline(width: int, chars: str = SPARK_CHARS):
+    """
+    Return a sparkline function specialised for a fixed width (and glyph set).
+    Lookup table, top index and padding are bound once in the closure; rendered
+    windows are memoized since frames between measurements repeat.
+    """
+    lut = tuple(chars)
+    top = len(lut) - 1
+    blank = " " * width
+
+    @functools.lru_cache(maxsize=64)
+    def _render(vals: Tuple[float, ...]) -> str:
+        mx = max(vals)
+        if mx <= 0:
+            mx = 1.0
+        # v / mx first: folding top / mx into one factor can round the
+        # maximum down to top - 1 (e.g. 2.59 * (7 / 2.59) < 7)
+        return "".join([lut[int(v / mx * top)] for v in vals]).rjust(width)
+
+    def spark(values: List[float]) -> str:
+        if not values:
+            return blank
+        return _render(tuple(values)[-width:])
+    return spark
 
 # ---------------- Main NetPulse class ----------------
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10  # same limit as urllib's HTTPRedirectHandler
+# history is kept at exactly the rendered trend width: nothing is stored
+# only to be sliced away at render time
+DOWNLOAD_TREND_WIDTH = 48
+PING_TREND_WIDTH = 30
+
 class NetPulse:
     def __init__(self, hosts: List[Tuple[str,int]], url: str, bytes_probe: int, interval: float):
         self.hosts = hosts
@@ -115,29 +267,231 @@ class NetPulse:
         self.interval = max(1.0, interval)
         self.running = False
         self.lock = threading.Lock()
-        # history deques
-        self.download_history = deque(maxlen=120)
-        self.ping_history = {f"{h[0]}:{h[1]}": deque(maxlen=120) for h in hosts}
+        # history: a deque for download, and one flat float32 ring buffer
+        # (row per host, PING_TREND_WIDTH columns) for pings
+        self.download_history = deque(maxlen=DOWNLOAD_TREND_WIDTH)
+        self._host_index = {hp: i for i, hp in enumerate(dict.fromkeys(f"{h}:{p}" for h, p in hosts))}
+        self._hist = array("f", [0.0]) * (len(self._host_index) * PING_TREND_WIDTH)
+        self._hist_idx = 0    # next column to write
+        self._hist_count = 0  # columns filled so far (<= PING_TREND_WIDTH)
         self.last_results = {}
         self.spinner_idx = 0
+        # sparkline renderers specialised for the two fixed widths in the frame
+        self._spark_dl = make_sparkline(DOWNLOAD_TREND_WIDTH)
+        self._spark_ping = make_sparkline(PING_TREND_WIDTH)
+        # bumped on every completed measurement; lets render() skip unchanged frames
+        self._version = 0
+        self._frame = None  # (version, rendered lines) of the last full frame
+        self._first_frame = True  # only the first frame wipes the whole screen
+        self._new_data = threading.Event()  # set after every completed measurement
+        # (host, port) -> (getaddrinfo result, resolved-at timestamp)
+        self._dns_cache: dict = {}
+        # persistent keep-alive connection for the download probe (opened lazily)
+        self._http = None
+        self._http_home = url  # where each round starts; moved only by 301/308
+        self._set_http_target(url)
+        # all TCP probes run as coroutines on one event loop in a daemon thread;
+        # blocking calls (DNS, the http.client download) get daemon threads too,
+        # so an in-flight one never holds up interpreter exit
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._run_loop, daemon=True).start()
+        # guards _closed / _downloading so no round is handed to the loop once
+        # stop() began, and exactly one side closes the keep-alive connection
+        self._round_lock = threading.Lock()
+        self._closed = False
+        self._downloading = False
+
+    def _run_loop(self):
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _run_in_daemon(self, fn, *args):
+        """Await fn(*args) run on a fresh daemon thread (unlike run_in_executor's workers)."""
+        fut = self._loop.create_future()
+
+        def settle(result, exc):
+            if not fut.done():  # the round may have been cancelled meanwhile
+                if exc is None:
+                    fut.set_result(result)
+                else:
+                    fut.set_exception(exc)
+
+        def worker():
+            try:
+                outcome = (fn(*args), None)
+            except BaseException as e:
+                outcome = (None, e)
+            try:
+                self._loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:
+                pass  # loop already closed by stop(); nobody is waiting
+        threading.Thread(target=worker, daemon=True).start()
+        return await fut
+
+    async def _resolve(self, host: str, port: int, ttl: float = 300.0) -> list:
+        """getaddrinfo() with a per-(host, port) cache that expires after ttl seconds."""
+        key = (host, port)
+        cached = self._dns_cache.get(key)
+        if cached is not None and time.time() - cached[1] < ttl:
+            return cached[0]
+        infos = await self._run_in_daemon(socket.getaddrinfo, host, port, 0, socket.SOCK_STREAM)
+        self._dns_cache[key] = (infos, time.time())
+        return infos
+
+    async def _tcp_connect_time_async(self, host: str, port: int, timeout: float = 1.2) -> float:
+        """Return TCP connect time in ms to host:port (resolved via the cache), or None on failure."""
+        try:
+            af, socktype, proto, _, sockaddr = pick_address(await self._resolve(host, port))
+            with socket.socket(af, socktype, proto) as s:
+                s.setblocking(False)
+                start = time.perf_counter_ns()
+                await asyncio.wait_for(self._loop.sock_connect(s, sockaddr), timeout)
+                return (time.perf_counter_ns() - start) / 1_000_000
+        except Exception:
+            return None
+
+    async def _download_async(self) -> Tuple[int, float]:
+        with self._round_lock:
+            if self._closed:
+                return 0, 0.0
+            self._downloading = True
+        return await self._run_in_daemon(self._download_round)
+
+    def _download_round(self) -> Tuple[int, float]:
+        try:
+            return self._download_keepalive(6.0)
+        finally:
+            with self._round_lock:
+                self._downloading = False
+                closed = self._closed
+            if closed:
+                # stop() ran mid-download and left the connection to us
+                self._close_http()
+
+    async def _shutdown(self):
+        """Cancel the in-flight round (if any) and wait for it to unwind."""
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _gather(self):
+        """Run every TCP probe and the download probe concurrently; returns (pings, download)."""
+        pings = asyncio.gather(*[self._tcp_connect_time_async(h, p) for h, p in self.hosts])
+        pings, download = await asyncio.gather(pings, self._download_async())
+        return pings, download
+
+    def _close_http(self):
+        conn, self._http = self._http, None
+        if conn is not None:
+            conn.close()
+
+    def _set_http_target(self, url: str):
+        """
+        Point the keep-alive probe at url. Only plain http(s) URLs reached
+        without a proxy can use the raw connection; anything else (other
+        schemes, http_proxy/https_proxy in effect, no ssl module) is probed
+        through urllib's download_probe() instead.
+        """
+        self._http_url = url
+        try:
+            parts = urllib.parse.urlsplit(url)
+            self._http_port = parts.port  # raises on a malformed port
+        except ValueError:
+            # let download_probe() fail and report it like any other bad URL
+            self._http_direct = False
+            return
+        self._http_scheme = parts.scheme.lower()
+        self._http_host = parts.hostname
+        self._http_path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        proxies = urllib.request.getproxies()
+        self._http_direct = (
+            self._http_host is not None
+            and (self._http_scheme == "http"
+                 or (self._http_scheme == "https" and hasattr(http.client, "HTTPSConnection")))
+            and (self._http_scheme not in proxies or bool(urllib.request.proxy_bypass(self._http_host)))
+        )
+
+    def _download_keepalive(self, timeout: float = 6.0) -> Tuple[int, float]:
+        """
+        download_probe() over a connection kept open between rounds, so only
+        the first probe (or one after a disconnect) pays for the handshake.
+        Redirects are followed; only permanent ones (301/308) stick for later rounds.
+        Only the body read is timed. Returns (bytes_read, seconds_elapsed).
+        """
+        headers = dict(_probe_headers(self.bytes_probe), Connection="keep-alive")
+        if self._http_url != self._http_home:
+            # last round followed a temporary redirect: ask the original URL again
+            self._close_http()
+            self._set_http_target(self._http_home)
+        attempt = redirects = 0
+        permanent = True
+        while True:
+            if not self._http_direct:
+                return download_probe(self._http_url, self.bytes_probe, timeout)
+            try:
+                if self._http is None:
+                    conn_cls = TunedHTTPSConnection if self._http_scheme == "https" else TunedHTTPConnection
+                    self._http = conn_cls(self._http_host, self._http_port, timeout=timeout)
+                self._http.request("GET", self._http_path, headers=headers)
+                resp = self._http.getresponse()
+                location = resp.getheader("Location")
+                if resp.status in REDIRECT_CODES and location and redirects < MAX_REDIRECTS:
+                    self._close_http()
+                    self._set_http_target(urllib.parse.urljoin(self._http_url, location))
+                    permanent = permanent and resp.status in (301, 308)
+                    if permanent:
+                        self._http_home = self._http_url
+                    redirects += 1
+                    continue
+                if resp.status not in (200, 206):
+                    self._close_http()
+                    return 0, 0.0
+                start = time.perf_counter_ns()
+                read = _read_body(resp, self.bytes_probe, timeout, self._http.sock)
+                elapsed = (time.perf_counter_ns() - start) / 1_000_000_000
+                # a server that ignored Range (or a read cut off by the deadline)
+                # leaves unread body on the wire: start over next time
+                if resp.will_close or not resp.isclosed():
+                    self._close_http()
+                return read, elapsed
+            except socket.timeout:
+                self._close_http()
+                return 0, 0.0
+            except (http.client.HTTPException, OSError):
+                # stale keep-alive connection (RemoteDisconnected etc.): reopen once
+                self._close_http()
+                if attempt:
+                    return 0, 0.0
+                attempt += 1
+            except Exception:
+                self._close_http()
+                return 0, 0.0
 
     def measure_once(self):
         """Perform one round of measurements (latency + download)."""
-        results = {}
-        # measure pings (TCP connect)
-        for host, port in self.hosts:
-            ms = tcp_connect_time(host, port, timeout=1.2)
-            results[f"{host}:{port}"] = ms  # ms or None
-        # measure download
-        bytes_read, seconds = download_probe(self.url, bytes_to_read=self.bytes_probe, timeout=6.0)
+        # fire all probes at once (TCP connects + download) on the event loop
+        with self._round_lock:
+            if self._closed:
+                raise RuntimeError("NetPulse has been stopped")
+            round_ = asyncio.run_coroutine_threadsafe(self._gather(), self._loop)
+        # raises CancelledError if stop() cancels the round
+        pings, (bytes_read, seconds) = round_.result()
+        results = {f"{host}:{port}": ms for (host, port), ms in zip(self.hosts, pings)}  # ms or None
         bps = (bytes_read / seconds) if seconds > 0 else 0.0
         # update histories
         with self.lock:
             # update download history
             self.download_history.append(bps)
-            for hp, val in results.items():
-                self.ping_history[hp].append(val if val is not None else 0.0)
+            col_idx = self._hist_idx
+            for hp, row in self._host_index.items():
+                self._hist[row * PING_TREND_WIDTH + col_idx] = results.get(hp) or 0.0
+            self._hist_idx = (col_idx + 1) % PING_TREND_WIDTH
+            self._hist_count = min(self._hist_count + 1, PING_TREND_WIDTH)
             self.last_results = {"pings": results, "download_bps": bps, "bytes": bytes_read, "elapsed": seconds}
+            self._version += 1
         return self.last_results
 
     def start(self):
@@ -145,55 +499,133 @@ class NetPulse:
         # run in background thread loop
         def loop():
             while self.running:
+                t0 = time.perf_counter()
                 try:
                     self.measure_once()
+                    self._new_data.set()
                 except Exception:
                     pass
-                time.sleep(self.interval)
+                # keep a fixed cadence: the probe time counts towards the interval
+                time.sleep(max(0.0, self.interval - (time.perf_counter() - t0)))
         t = threading.Thread(target=loop, daemon=True)
         t.start()
 
     def stop(self):
         self.running = False
+        with self._round_lock:
+            if self._closed:
+                return
+            self._closed = True
+            busy = self._downloading
+        # cancelling the round wakes a measurement thread blocked on its result
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=2.0)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        # a download already running can't be cancelled; its thread closes the
+        # connection when it finishes instead of us closing it underneath it
+        if not busy:
+            self._close_http()
 
     def snapshot(self):
         with self.lock:
-            return dict(self.last_results), list(self.download_history), {k: list(v) for k, v in self.ping_history.items()}
+            return (dict(self.last_results), list(self.download_history),
+                    self._ping_history(), self._version)
+
+    def _ping_history(self) -> dict:
+        """Unroll the ring buffer into {host:port: [oldest .. newest]}. Caller holds the lock."""
+        idx, count = self._hist_idx, self._hist_count
+        out = {}
+        for hp, row in self._host_index.items():
+            base = row * PING_TREND_WIDTH
+            ordered = self._hist[base + idx:base + PING_TREND_WIDTH] + self._hist[base:base + idx]
+            out[hp] = ordered[PING_TREND_WIDTH - count:].tolist()
+        return out
 
 # ---------------- Terminal rendering ----------------
-def render(net: NetPulse):
-    # render single frame
-    (res, dl_hist, p_hist) = net.snapshot()
-    clear()
-    print(col("─" * 72, DIM))
-    print(col("NetPulse — Live Network Monitor", BOLD + FG_CYAN) + "    " + col(now_ts(), DIM))
-    print(col("Python • Lightweight • Press Ctrl+C to exit", DIM))
-    print(col("─" * 72, DIM))
+# 1-based screen rows of the lines that change between measurements
+TITLE_ROW = 2
+
+# static, pre-colored frame pieces (built once instead of per frame)
+DIM_RULE72 = col("─" * 72, DIM)
+DASH_RULE72 = col("-" * 72, DIM)
+TITLE_PREFIX = col("NetPulse — Live Network Monitor", BOLD + FG_CYAN) + "    " + DIM
+SUBTITLE_LINE = col("Python • Lightweight • Press Ctrl+C to exit", DIM)
+DOWNLOAD_LABEL = col("Download:", FG_BLUE) + " " + BOLD + FG_GREEN
+HISTORY_LABEL = col("History:", DIM) + " "
+HEADER_ROW = col(f"{'Host:Port':22} {'Ping (ms)':12} {'Trend':30}", BOLD)
+PROBE_URL_LABEL = col("Probe URL:", DIM) + " "
+INTERVAL_LABEL = col("Update interval:", DIM) + " "
+BYTES_LABEL = col("Bytes/read per probe:", DIM) + " "
+SPINNER_LINES = tuple(col(f"{col(spinner(i), FG_CYAN)} Running... (Ctrl+C to stop)", DIM) for i in range(4))
+
+def _title_line() -> str:
+    return TITLE_PREFIX + now_ts() + RESET
+
+def _spinner_line(net: NetPulse) -> str:
+    return SPINNER_LINES[net.spinner_idx]
+
+def build_frame(net: NetPulse, res: dict, dl_hist: List[float], p_hist: dict) -> List[str]:
+    """Format one full frame as a list of lines (no trailing newlines)."""
+    lines = [DIM_RULE72, _title_line(), SUBTITLE_LINE, DIM_RULE72]
     # download
     bps = res.get("download_bps") if res else None
     human = human_mbps(bps) if bps else "n/a"
-    print()
-    print(col("Download:", FG_BLUE), col(human, BOLD + FG_GREEN), f"({res.get('bytes',0)} bytes in {res.get('elapsed',0):.2f}s)" if res else "")
+    detail = f"({res.get('bytes',0)} bytes in {res.get('elapsed',0):.2f}s)" if res else ""
+    lines.append("")
+    lines.append(f"{DOWNLOAD_LABEL}{human}{RESET} {detail}")
     # sparkline
-    print(col("History:", DIM), sparkline(dl_hist, width=48))
-    print()
+    lines.append(HISTORY_LABEL + net._spark_dl(dl_hist))
+    lines.append("")
     # pings table
-    print(col(f"{'Host:Port':22} {'Ping (ms)':12} {'Trend':30}", BOLD))
-    print(col("-" * 72, DIM))
+    lines.append(HEADER_ROW)
+    lines.append(DASH_RULE72)
     if res:
         for hp, val in res["pings"].items():
             hist = p_hist.get(hp, [])
             last = val
             last_str = f"{last:.1f} ms" if last and last > 0 else "timeout"
-            trend = sparkline(hist, width=30)
-            print(f"{col(hp, FG_CYAN):22} {col(last_str, FG_YELLOW):12} {trend:30}")
+            trend = net._spark_ping(hist)
+            lines.append(f"{col(hp, FG_CYAN):22} {col(last_str, FG_YELLOW):12} {trend:30}")
+    else:
+        lines.append("No results yet...")
+    lines.append("")
+    lines.append(PROBE_URL_LABEL + net.url)
+    lines.append(f"{INTERVAL_LABEL}{net.interval}s    {BYTES_LABEL}{net.bytes_probe}")
+    lines.append(DIM_RULE72)
+    lines.append(_spinner_line(net))
+    return lines
+
+def render(net: NetPulse):
+    # render single frame; the cheap in-place repaint needs ANSI and a frame
+    # that fits on screen (absolute rows are wrong once it has scrolled)
+    if (not _use_cls and net._frame is not None and net._frame[0] == net._version
+            and len(net._frame[1]) < shutil.get_terminal_size().lines):
+        # nothing new measured: only repaint the clock and the spinner in place
+        n = len(net._frame[1])
+        sys.stdout.write(f"\x1b[{TITLE_ROW};1H{_title_line()}{ERASE_EOL}"
+                         f"\x1b[{n};1H{_spinner_line(net)}{ERASE_EOL}\x1b[{n + 1};1H")
+        sys.stdout.flush()
     else:
-        print("No results yet...")
-    print()
-    print(col("Probe URL:", DIM), net.url)
-    print(col("Update interval:", DIM), f"{net.interval}s   ", col("Bytes/read per probe:", DIM), net.bytes_probe)
-    print(col("─" * 72, DIM))
-    print(col(f"{col(spinner(net.spinner_idx), FG_CYAN)} Running... (Ctrl+C to stop)", DIM))
+        (res, dl_hist, p_hist, version) = net.snapshot()
+        lines = build_frame(net, res, dl_hist, p_hist)
+        net._frame = (version, lines)
+        # one write per frame, overwritten in place after the first
+        buf = []
+        if _use_cls:
+            # no VT mode: cls every frame and no cursor escapes
+            clear()
+            buf.extend(line + "\n" for line in lines)
+        else:
+            if net._first_frame:
+                net._first_frame = False
+                buf.append(CLEAR_SCREEN)
+            buf.append(CURSOR_HOME + HIDE_CURSOR)
+            buf.extend(line + ERASE_EOL + "\n" for line in lines)
+            buf.append(ERASE_BELOW)
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
     net.spinner_idx = (net.spinner_idx + 1) % 4
 
 # ---------------- CLI & run ----------------
@@ -218,6 +650,7 @@ def default_hosts():
     return [("8.8.8.8", 53), ("1.1.1.1", 53), ("google.com", 80)]
 
 def main():
+    global _use_cls
     p = argparse.ArgumentParser(description="NetPulse — live network monitor (modern terminal UI).")
     p.add_argument("--hosts", help="Comma-separated host:port list (default: 8.8.8.8:53,1.1.1.1:53,google.com:80)", default=None)
     p.add_argument("--url", help="URL to fetch small chunk from for download speed test (default small file)", default="http://ipv4.download.thinkbroadband.com/5MB.zip")
@@ -225,23 +658,27 @@ def main():
     p.add_argument("--interval", type=float, help="Seconds between probes (default 2)", default=2.0)
     args = p.parse_args()
 
+    # one-time console setup instead of spawning `cls` on every frame
+    _use_cls = not enable_vt_mode()
     hosts = parse_hosts(args.hosts) if args.hosts else default_hosts()
     npulse = NetPulse(hosts=hosts, url=args.url, bytes_probe=args.bytes, interval=args.interval)
     try:
         npulse.start()
-        # initial small wait so first measurement completes quickly
-        time.sleep(0.2)
-        # main render loop
+        # main render loop: redraw as soon as a measurement lands; the 1s
+        # timeout keeps the clock and spinner ticking in between
         while True:
+            npulse._new_data.wait(timeout=1.0)
+            npulse._new_data.clear()
             render(npulse)
-            time.sleep( max(0.5, args.interval / 2) )
     except KeyboardInterrupt:
         npulse.stop()
+        if not _use_cls:
+            sys.stdout.write(SHOW_CURSOR)
         clear()
         print(col("─" * 60, DIM))
         print(col("NetPulse Stopped.", BOLD + FG_CYAN))
         print(col("Summary snapshot:", DIM))
-        snap, dh, ph = npulse.snapshot()
+        snap, dh, ph, _ = npulse.snapshot()
         if snap:
             print(col(f"Last download: {human_mbps(snap.get('download_bps',0))} ({snap.get('bytes',0)} bytes in {snap.get('elapsed',0):.2f}s)", FG_GREEN))
             for hp, v in snap.get("pings",{}).items():
@@ -252,6 +689,8 @@ def main():
         print(col("Goodbye 👋 , By Cryptonic Area", DIM))
     except Exception as e:
         npulse.stop()
+        if not _use_cls:
+            sys.stdout.write(SHOW_CURSOR)
         clear()
         print(col(f"Fatal error: {e}", FG_RED))
         sys.exit(1)